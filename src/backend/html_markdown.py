@@ -5,6 +5,7 @@
 
 import re
 from contextlib import suppress
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import unquote
 
@@ -253,8 +254,31 @@ class HTMLProcessor:
         outgoing:              bool                     = False,
         display_name_mentions: Optional[Dict[str, str]] = None,
     ) -> str:
-        """Filter and return HTML."""
+        """Filter and return HTML.
 
+        Results are cached when no `display_name_mentions` are passed, as the
+        same content is often filtered many times, e.g. for state events while
+        syncing or for repeated bot messages.
+        """
+
+        if display_name_mentions is None:
+            return self._cached_filter(html, inline, outgoing)
+
+        return self._filter(html, inline, outgoing, display_name_mentions)
+
+
+    @lru_cache(maxsize=1024)
+    def _cached_filter(self, html: str, inline: bool, outgoing: bool) -> str:
+        return self._filter(html, inline, outgoing)
+
+
+    def _filter(
+        self,
+        html:                  str,
+        inline:                bool                     = False,
+        outgoing:              bool                     = False,
+        display_name_mentions: Optional[Dict[str, str]] = None,
+    ) -> str:
         mentions = display_name_mentions
 
         sanit = Sanitizer(self.sanitize_settings(inline, outgoing, mentions))
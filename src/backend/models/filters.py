@@ -87,7 +87,9 @@ class ModelFilter(ModelProxy):
             take_out   = []
             bring_back = []
 
-            for key, item in sorted(self.items(), key=lambda kv: kv[1]):
+            items = sorted(self.items(), key=lambda kv: kv[1].sort_key)
+
+            for key, item in items:
                 if only_if and not only_if(item):
                     continue
 
@@ -4,17 +4,19 @@
 """`ModelItem` subclasses definitions."""
 
 import json
+import sys
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Type, Union
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Type, Union
 from uuid import UUID
 
 import lxml  # nosec
 import nio
 
+from ..presence import ORDER as PRESENCE_ORDER
 from ..presence import Presence
-from ..utils import AutoStrEnum, auto, strip_html_tags
+from ..utils import AutoStrEnum, auto, slotted, strip_html_tags
 from .model_item import ModelItem
 
 OptionalExceptionType = Union[Type[None], Type[Exception]]
@@ -48,6 +50,7 @@ class RoomNotificationOverride(AutoStrEnum):
     IgnoreEvents       = auto()
 
 
+@slotted
 @dataclass(eq=False)
 class Homeserver(ModelItem):
     """A homeserver we can connect to. The `id` field is the server's URL."""
@@ -61,13 +64,17 @@ class Homeserver(ModelItem):
     stability:      float       = -1
     downtimes_ms:   List[float] = field(default_factory=list)
 
-    def __lt__(self, other: "Homeserver") -> bool:
-        return (self.name.lower(), self.id) < (other.name.lower(), other.id)
+    def _compute_sort_key(self) -> Tuple:
+        return (self.name.lower(), self.id)
 
 
 @dataclass(eq=False)
 class Account(ModelItem):
-    """A logged in matrix account."""
+    """A logged in matrix account.
+
+    Unlike other items, this class isn't `@slotted`: `AccountOrRoom` inherits
+    both it and `Room`, which can't be done if both have their own slots.
+    """
 
     id:               str      = field()
     order:            int      = -1
@@ -90,10 +97,11 @@ class Account(ModelItem):
     last_active_at:   datetime       = ZERO_DATE
     status_msg:       str            = ""
 
-    def __lt__(self, other: "Account") -> bool:
-        return (self.order, self.id) < (other.order, other.id)
+    def _compute_sort_key(self) -> Tuple:
+        return (self.order, self.id)
 
 
+@slotted
 @dataclass(eq=False)
 class PushRule(ModelItem):
     """A push rule configured for one of our account."""
@@ -113,7 +121,7 @@ class PushRule(ModelItem):
     sound:        str                  = ""  # usually "default" when set
     urgency_hint: bool                 = False
 
-    def __lt__(self, other: "PushRule") -> bool:
+    def _compute_sort_key(self) -> Tuple:
         return (
             self.kind is nio.PushRuleKind.underride,
             self.kind is nio.PushRuleKind.sender,
@@ -122,18 +130,11 @@ class PushRule(ModelItem):
             self.kind is nio.PushRuleKind.override,
             self.order,
             self.id,
-        ) < (
-            other.kind is nio.PushRuleKind.underride,
-            other.kind is nio.PushRuleKind.sender,
-            other.kind is nio.PushRuleKind.room,
-            other.kind is nio.PushRuleKind.content,
-            other.kind is nio.PushRuleKind.override,
-            other.order,
-            other.id,
         )
 
 
-@dataclass
+@slotted
+@dataclass(eq=False)
 class Room(ModelItem):
     """A matrix room we are invited to, are or were member of."""
 
@@ -186,39 +187,40 @@ class Room(ModelItem):
 
     # Allowed keys: "last_event_date", "unreads", "highlights", "local_unreads"
     # Keys in this dict will override their corresponding item fields for the
-    # __lt__ method. This is used when we want to lock a room's position,
+    # sort key. This is used when we want to lock a room's position,
     # e.g. to avoid having the room move around when it is focused in the GUI
     _sort_overrides: Dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        # These IDs are repeated across many items, interning them makes
+        # their copies share memory and speeds up equality checks
+        self.set_fields(
+            id          = sys.intern(self.id),
+            for_account = sys.intern(self.for_account),
+            inviter_id  = sys.intern(self.inviter_id),
+        )
+
     def _sorting(self, key: str) -> Any:
         return self._sort_overrides.get(key, getattr(self, key))
 
-    def __lt__(self, other: "Room") -> bool:
+    def _compute_sort_key(self) -> Tuple:
         by_activity = not self.lexical_sorting
 
         return (
             self.for_account,
-            other.pinned,
+            not self.pinned,
             self.left,  # Left rooms may have an inviter_id, check them first
-            bool(other.inviter_id),
-            bool(by_activity and other._sorting("highlights")),
-            bool(by_activity and other._sorting("unreads")),
-            bool(by_activity and other._sorting("local_unreads")),
-            other._sorting("last_event_date") if by_activity else ZERO_DATE,
+            not self.inviter_id,
+            not (by_activity and self._sorting("highlights")),
+            not (by_activity and self._sorting("unreads")),
+            not (by_activity and self._sorting("local_unreads")),
+
+            # Negated seconds, to have the most recently active rooms first
+            (ZERO_DATE - self._sorting("last_event_date")).total_seconds()
+            if by_activity else 0.0,
+
             (self.display_name or self.id).lower(),
             self.id,
-
-        ) < (
-            other.for_account,
-            self.pinned,
-            other.left,
-            bool(self.inviter_id),
-            bool(by_activity and self._sorting("highlights")),
-            bool(by_activity and self._sorting("unreads")),
-            bool(by_activity and self._sorting("local_unreads")),
-            self._sorting("last_event_date") if by_activity else ZERO_DATE,
-            (other.display_name or other.id).lower(),
-            other.id,
         )
 
 
@@ -233,39 +235,29 @@ class AccountOrRoom(Account, Room):
     type:          Union[Type[Account], Type[Room]] = Account
     account_order: int                              = -1
 
-    def __lt__(self, other: "AccountOrRoom") -> bool:  # type: ignore
+    def _compute_sort_key(self) -> Tuple:
         by_activity = not self.lexical_sorting
 
         return (
             self.account_order,
             self.id if self.type is Account else self.for_account,
-            other.type is Account,
-            other.pinned,
+            self.type is not Account,
+            not self.pinned,
             self.left,
-            bool(other.inviter_id),
-            bool(by_activity and other._sorting("highlights")),
-            bool(by_activity and other._sorting("unreads")),
-            bool(by_activity and other._sorting("local_unreads")),
-            other._sorting("last_event_date") if by_activity else ZERO_DATE,
+            not self.inviter_id,
+            not (by_activity and self._sorting("highlights")),
+            not (by_activity and self._sorting("unreads")),
+            not (by_activity and self._sorting("local_unreads")),
+
+            (ZERO_DATE - self._sorting("last_event_date")).total_seconds()
+            if by_activity else 0.0,
+
             (self.display_name or self.id).lower(),
             self.id,
-
-        ) < (
-            other.account_order,
-            other.id if other.type is Account else other.for_account,
-            self.type is Account,
-            self.pinned,
-            other.left,
-            bool(self.inviter_id),
-            bool(by_activity and self._sorting("highlights")),
-            bool(by_activity and self._sorting("unreads")),
-            bool(by_activity and self._sorting("local_unreads")),
-            self._sorting("last_event_date") if by_activity else ZERO_DATE,
-            (other.display_name or other.id).lower(),
-            other.id,
         )
 
 
+@slotted
 @dataclass(eq=False)
 class Member(ModelItem):
     """A member in a matrix room."""
@@ -285,21 +277,20 @@ class Member(ModelItem):
     last_active_at:   datetime       = ZERO_DATE
     status_msg:       str            = ""
 
-    def __lt__(self, other: "Member") -> bool:
+    def __post_init__(self) -> None:
+        # The same user can be a member of many rooms
+        self.id = sys.intern(self.id)
+
+    def _compute_sort_key(self) -> Tuple:
+        presence = Presence.State.offline if self.ignored else self.presence
+
         return (
             self.invited,
-            other.power_level,
+            -self.power_level,
             self.ignored,
-            Presence.State.offline if self.ignored else self.presence,
+            PRESENCE_ORDER[presence.value],
             (self.display_name or self.id[1:]).lower(),
             self.id,
-        ) < (
-            other.invited,
-            self.power_level,
-            other.ignored,
-            Presence.State.offline if other.ignored else other.presence,
-            (other.display_name or other.id[1:]).lower(),
-            other.id,
         )
 
 
@@ -312,6 +303,7 @@ class TransferStatus(AutoStrEnum):
     Error       = auto()
 
 
+@slotted
 @dataclass(eq=False)
 class Transfer(ModelItem):
     """Represent a running or failed file upload/download operation."""
@@ -333,10 +325,12 @@ class Transfer(ModelItem):
     start_date: datetime = field(init=False, default_factory=datetime.now)
 
 
-    def __lt__(self, other: "Transfer") -> bool:
-        return (self.start_date, self.id) > (other.start_date, other.id)
+    def _compute_sort_key(self) -> Tuple:
+        # Newest transfers first
+        return ((ZERO_DATE - self.start_date).total_seconds(), -self.id.int)
 
 
+@slotted
 @dataclass(eq=False)
 class Event(ModelItem):
     """A matrix state event or message."""
@@ -350,11 +344,11 @@ class Event(ModelItem):
     sender_avatar: str                 = field()
     fetch_profile: bool                = False
 
-    content:           str                   = ""
-    inline_content:    str                   = ""
-    reason:            str                   = ""
-    links:             List[str]             = field(default_factory=list)
-    mentions:          List[Tuple[str, str]] = field(default_factory=list)
+    content:           str                       = ""
+    inline_content:    str                       = ""
+    reason:            str                       = ""
+    links:             Sequence[str]             = ()
+    mentions:          Sequence[Tuple[str, str]] = ()
 
     type_specifier: TypeSpecifier = TypeSpecifier.Unset
 
@@ -388,8 +382,17 @@ class Event(ModelItem):
     thumbnail_height:     int            = 0
     thumbnail_crypt_dict: Dict[str, Any] = field(default_factory=dict)
 
-    def __lt__(self, other: "Event") -> bool:
-        return (self.date, self.id) > (other.date, other.id)
+    def __post_init__(self) -> None:
+        # User IDs are repeated in every event they send or are targeted by
+        self.set_fields(
+            sender_id   = sys.intern(self.sender_id),
+            target_id   = sys.intern(self.target_id),
+            redacter_id = sys.intern(self.redacter_id),
+        )
+
+    def _compute_sort_key(self) -> Tuple:
+        # Newest events first
+        return ((ZERO_DATE - self.date).total_seconds(), self.id)
 
     @property
     def plain_content(self) -> str:
@@ -401,8 +404,15 @@ class Event(ModelItem):
         return strip_html_tags(self.content)
 
     @staticmethod
-    def parse_links(text: str) -> List[str]:
-        """Return list of URLs (`<a href=...>` tags) present in the content."""
+    def parse_links(text: str) -> Sequence[str]:
+        """Return URLs (`<a href=...>` tags) present in the content.
+
+        The shared empty tuple is returned for content without any link.
+        """
+
+        # Without any tag, there can't be links: avoid parsing with lxml
+        if "<" not in text:
+            return ()
 
         ignore = []
 
@@ -422,16 +432,16 @@ class Event(ModelItem):
             ]
 
         if not text.strip():
-            return []
+            return ()
 
         return [
             url for el, attrib, url, pos in lxml.html.iterlinks(text)
             if lxml.etree.tostring(el) not in ignore
-        ]
+        ] or ()
 
     def serialized_field(self, field: str) -> Any:
         if field == "source":
             source_dict = asdict(self.source) if self.source else {}
             return json.dumps(source_dict)
 
-        return super().serialized_field(field)
+        return ModelItem.serialized_field(self, field)
@@ -3,12 +3,13 @@
 
 import itertools
 from contextlib import contextmanager
+from operator import attrgetter
 from threading import RLock
 from typing import (
     TYPE_CHECKING, Any, Dict, Iterator, List, MutableMapping, Optional, Tuple,
 )
 
-from sortedcontainers import SortedList
+from sortedcontainers import SortedKeyList
 
 from ..pyotherside_events import ModelCleared, ModelItemDeleted, ModelItemSet
 from ..utils import serialize_value_for_qml
@@ -30,7 +31,7 @@ class Model(MutableMapping):
     model is cleared, corresponding `PyOtherSideEvent` are fired to inform
     QML of the changes so that it can keep its models in sync.
 
-    Items in the model are kept sorted using the `ModelItem` subclass `__lt__`.
+    Items in the model are kept sorted by their `ModelItem.sort_key`.
     """
 
     instances: Dict[SyncId, "Model"]      = {}
@@ -38,10 +39,12 @@ class Model(MutableMapping):
 
 
     def __init__(self, sync_id: Optional[SyncId]) -> None:
-        self.sync_id:      Optional[SyncId]        = sync_id
-        self.write_lock:   RLock                   = RLock()
-        self._data:        Dict[Any, "ModelItem"]  = {}
-        self._sorted_data: SortedList["ModelItem"] = SortedList()
+        self.sync_id:      Optional[SyncId]           = sync_id
+        self.write_lock:   RLock                      = RLock()
+        self._data:        Dict[Any, "ModelItem"]     = {}
+        self._sorted_data: SortedKeyList["ModelItem"] = SortedKeyList(
+            key=attrgetter("sort_key"),
+        )
 
         self.take_items_ownership: bool = True
 
@@ -84,10 +87,7 @@ class Model(MutableMapping):
             changed_fields = _changed_fields or {}
 
             if not changed_fields:
-                for field in new.__dataclass_fields__:  # type: ignore
-                    if field.startswith("_"):
-                        continue
-
+                for field in new.serialized_field_names():
                     changed = True
 
                     if existing:
@@ -1,8 +1,8 @@
 # Copyright Mirage authors & contributors <https://github.com/mirukana/mirage>
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Optional, Tuple
 
 from ..pyotherside_events import ModelItemSet
 from ..utils import serialize_value_for_qml
@@ -17,39 +17,137 @@ class ModelItem:
 
     This class must be subclassed and not used directly.
     All subclasses must use the `@dataclass(eq=False)` decorator.
+    Subclasses with many instances should also be decorated with
+    `utils.slotted`.
 
-    Subclasses are also expected to implement `__lt__()`,
+    Subclasses are also expected to implement `_compute_sort_key()`,
     to provide support for comparisons with the `<`, `>`, `<=`, `=>` operators
     and thus allow a `Model` to keep its data sorted.
 
-    Make sure to respect SortedList requirements when implementing `__lt__()`:
+    Make sure to respect SortedKeyList requirements when implementing
+    `_compute_sort_key()`:
     http://www.grantjenks.com/docs/sortedcontainers/introduction.html#caveats
     """
 
+    __slots__ = ("parent_model", "_sort_key")
+
+    if TYPE_CHECKING:
+        # For type checkers only: at runtime, these are slots and not fields
+        parent_model: Optional["Model"] = field(init=False, repr=False)
+        _sort_key:    Optional[Tuple]   = field(init=False, repr=False)
+
     id: Any = field()
 
 
     def __new__(cls, *_args, **_kwargs) -> "ModelItem":
-        cls.parent_model: Optional[Model] = None
-        return super().__new__(cls)
+        item = super().__new__(cls)
+        object.__setattr__(item, "parent_model", None)
+        object.__setattr__(item, "_sort_key", None)
+        return item
+
+
+    def __lt__(self, other: "ModelItem") -> bool:
+        return self.sort_key < other.sort_key
 
 
     def __setattr__(self, name: str, value) -> None:
-        self.set_fields(**{name: value})
+        if self.parent_model:
+            self.set_fields(**{name: value})
+            return
+
+        # Not in a model, e.g. the dataclass __init__ setting every field:
+        # skip the overhead of set_fields(), while keeping its behavior
+        object.__setattr__(self, name, value)
+
+        if self._sort_key is not None:
+            object.__setattr__(self, "_sort_key", None)
 
 
     def __delattr__(self, name: str) -> None:
         raise NotImplementedError()
 
 
+    def __setstate__(self, state: Any) -> None:
+        # Used by copy(), deepcopy() and pickle. Like the default behavior for
+        # objects without slots, restore attributes without going through
+        # set_fields(), which would try to update an eventual parent model.
+        # Objects with slots have a `(__dict__ or None, slots dict)` state.
+
+        if not isinstance(state, tuple):
+            state = (state, None)
+
+        for part in state:
+            for name, value in (part or {}).items():
+                object.__setattr__(self, name, value)
+
+
+    @property
+    def sort_key(self) -> Tuple:
+        """Return `_compute_sort_key()`'s result, cached until fields change.
+
+        Comparing keys avoids rebuilding tuples and calling `str.lower()` and
+        such for every comparison made while sorting.
+        """
+
+        key = self._sort_key
+
+        if key is None:
+            key = self._compute_sort_key()
+            object.__setattr__(self, "_sort_key", key)
+
+        return key
+
+
+    def _compute_sort_key(self) -> Tuple:
+        """Return a value that sorts lower for items coming first in models.
+
+        The returned value should be a tuple. Fields for which the sort order
+        is to be inverted must be negated, e.g. with `-number` or `not bool`.
+        """
+
+        raise NotImplementedError()
+
+
+    @classmethod
+    def serialized_field_names(cls) -> Tuple[str, ...]:
+        """Return the names of fields passed to QML, in definition order.
+
+        Fields with a name starting with `_` are private and excluded.
+        The result is computed on first call and cached for the class.
+        """
+
+        try:
+            return cls.__dict__["_serialized_names"]
+        except KeyError:
+            names = tuple([
+                f.name for f in fields(cls) if not f.name.startswith("_")
+            ])
+            cls._serialized_names = names  # type: ignore
+            return names
+
+
+    @classmethod
+    def serialized_field_set(cls) -> FrozenSet[str]:
+        """Return `serialized_field_names()` as a cached `frozenset`.
+
+        This is meant for fast membership tests, e.g. when fields are set.
+        """
+
+        try:
+            return cls.__dict__["_serialized_set"]
+        except KeyError:
+            names = frozenset(cls.serialized_field_names())
+            cls._serialized_set = names  # type: ignore
+            return names
+
+
     @property
     def serialized(self) -> Dict[str, Any]:
         """Return this item as a dict ready to be passed to QML."""
 
         return {
             name: self.serialized_field(name)
-            for name in self.__dataclass_fields__  # type: ignore
-            if not name.startswith("_")
+            for name in self.serialized_field_names()
         }
 
 
@@ -73,9 +171,13 @@ class ModelItem:
         if not parent:
             for name, value in fields.items():
                 super().__setattr__(name, value)
+
+            if self._sort_key is not None:
+                super().__setattr__("_sort_key", None)
             return
 
         with parent.write_lock:
+            qml_fields  = self.serialized_field_set()
             qml_changes = {}
             changes     = {
                 name: value for name, value in fields.items()
@@ -85,19 +187,19 @@ class ModelItem:
             if not changes:
                 return
 
-            # To avoid corrupting the SortedList, we have to take out the item,
-            # apply the field changes, *then* add it back in.
+            # To avoid corrupting the SortedKeyList, we have to take out the
+            # item, apply the field changes, *then* add it back in.
 
             index_then = parent._sorted_data.index(self)
             del parent._sorted_data[index_then]
 
             for name, value in changes.items():
                 super().__setattr__(name, value)
-                is_field = name in self.__dataclass_fields__  # type: ignore
 
-                if is_field and not name.startswith("_"):
+                if name in qml_fields:
                     qml_changes[name] = self.serialized_field(name)
 
+            super().__setattr__("_sort_key", None)
             parent._sorted_data.add(self)
             index_now    = parent._sorted_data.index(self)
             index_change = index_then != index_now
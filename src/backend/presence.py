@@ -5,7 +5,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Dict, Optional
 
-from .utils import AutoStrEnum, auto
+from .utils import AutoStrEnum, auto, slotted
 
 if TYPE_CHECKING:
     from .models.items import Account, Member
@@ -18,6 +18,7 @@ ORDER: Dict[str, int] = {
 }
 
 
+@slotted
 @dataclass
 class Presence:
     """Represents a single matrix user's presence fields.
@@ -14,6 +14,7 @@ import sys
 import xml.etree.cElementTree as xml_etree
 from concurrent.futures import ProcessPoolExecutor
 from contextlib import suppress
+from dataclasses import fields
 from datetime import date, datetime, time, timedelta
 from enum import Enum
 from enum import auto as autostr
@@ -22,7 +23,7 @@ from tempfile import NamedTemporaryFile
 from types import ModuleType
 from typing import (
     Any, AsyncIterator, Callable, Collection, Dict, Iterable, Mapping,
-    Optional, Tuple, Type, Union,
+    Optional, Tuple, Type, TypeVar, Union,
 )
 from uuid import UUID
 
@@ -45,6 +46,7 @@ else:
 
 Size       = Tuple[int, int]
 BytesOrPIL = Union[bytes, PILImage.Image]
+ClassType  = TypeVar("ClassType", bound=type)
 auto       = autostr
 
 COMPRESSION_POOL = ProcessPoolExecutor()
@@ -313,6 +315,42 @@ def classes_defined_in(module: ModuleType) -> Dict[str, Type]:
     }
 
 
+def slotted(cls: ClassType) -> ClassType:
+    """Recreate a dataclass with `__slots__` for its own fields.
+
+    This is the equivalent of Python 3.10's `@dataclass(slots=True)`, which
+    can't be used while we support older Python versions.
+    Instances of the returned class have no `__dict__`, making them smaller
+    and their attributes faster to access.
+    Must be placed above the `@dataclass` decorator.
+
+    Like with `slots=True`, the zero-argument form of `super()` must not be
+    used in the methods of decorated classes, as it would still refer to
+    the original class.
+    """
+
+    inherited = {
+        name
+        for base in cls.__mro__[1:]
+        for name in base.__dict__.get("__slots__", ())
+    }
+
+    own_fields = tuple(
+        f.name for f in fields(cls) if f.name not in inherited
+    )
+
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = own_fields
+
+    for name in own_fields:
+        # Class attributes holding field default values would conflict
+        cls_dict.pop(name, None)
+
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
 @asynccontextmanager
 async def aiopen(*args, **kwargs) -> AsyncIterator[Any]:
     """Wrapper for `aiofiles.open()` that doesn't break mypy"""